@@ -1,9 +1,15 @@
 import sys
 import os
+import io
+import atexit
+import threading
+import weakref
 from enum import Enum
-from typing import Optional, Union, List, Callable
+from types import MappingProxyType
+from typing import Optional, Union, List, Tuple, Callable, Mapping
 from functools import wraps
 from contextlib import contextmanager
+from contextvars import ContextVar
 import builtins
 
 
@@ -65,6 +71,32 @@ class BackgroundColor(Enum):
     WHITE = "\033[107m"
 
 
+# Name to ANSI code mappings, built once at import and shared by all terminals
+_COLORS = MappingProxyType({color.name.lower(): color.value for color in TerminalColor})
+_BACKGROUNDS = MappingProxyType(
+    {color.name.lower(): color.value for color in BackgroundColor}
+)
+_STYLES = MappingProxyType({style.name.lower(): style.value for style in Style})
+_RESET = TerminalColor.RESET.value
+
+
+def _isatty(stream) -> bool:
+    return hasattr(stream, "isatty") and stream.isatty()
+
+
+def _norm_styles(styles: Optional[Union[str, List[str]]]) -> Optional[Tuple[str, ...]]:
+    """Normalize a style name or list of style names to a hashable tuple."""
+    if not styles:
+        return None
+    return (styles,) if isinstance(styles, str) else tuple(styles)
+
+
+# Styled print function of each terminal's innermost active color_context
+_active_styled_prints: ContextVar[Mapping["Terminal", Callable]] = ContextVar(
+    "active_styled_prints", default=MappingProxyType({})
+)
+
+
 def check_terminal_support(func):
     """
     Decorator to check if the terminal supports color output.
@@ -96,44 +128,95 @@ class ColoredStdout:
     Custom stdout wrapper for handling color codes.
 
     Attributes:
-        terminal (Terminal): The terminal instance that contains the original stdout.
-        buffer (list): A list to buffer the text before writing to the original stdout.
+        buffer (io.StringIO): A buffer for the text before writing to stdout.
+        buffer_size (int): Number of buffered characters that triggers a flush.
+        line_buffering (bool): Whether to flush whenever a newline is written.
+        lock (threading.Lock): Lock guarding the buffer across threads.
 
     Methods:
         write(text: str) -> None:
-            Buffer the text to be written.
+            Buffer the text to be written, flushing once the buffer is full or,
+            with line buffering, on a newline.
 
         flush() -> None:
-            Flush the buffer to the original stdout.
+            Flush the buffer to the current sys.stdout.
+
+        isatty() -> bool:
+            Always False, so callers don't flush the buffer after each line.
+
+    Any text still buffered is flushed when the object is garbage collected.
     """
 
-    def __init__(self, terminal):
-        self.terminal = terminal
-        self.buffer = []
+    __slots__ = ("buffer", "buffer_size", "line_buffering", "lock")
+
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, buffer_size: int = BUFFER_SIZE, line_buffering: bool = False):
+        self.buffer = io.StringIO()
+        self.buffer_size = buffer_size
+        self.line_buffering = line_buffering
+        self.lock = threading.Lock()
 
     def write(self, text: str) -> None:
-        self.buffer.append(text)
+        with self.lock:
+            self.buffer.write(text)
+            if self.buffer.tell() >= self.buffer_size or (
+                self.line_buffering and "\n" in text
+            ):
+                self._flush_locked()
 
     def flush(self) -> None:
-        if self.buffer:
-            text = "".join(self.buffer)
-            self.terminal._original_stdout.write(text)
-            self.terminal._original_stdout.flush()
-            self.buffer = []
+        with self.lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        # Read, write out and reset under one lock so no text is lost or repeated
+        text = self.buffer.getvalue()
+        if text:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+            self.buffer.seek(0)
+            self.buffer.truncate()
+
+    def isatty(self) -> bool:
+        return False
+
+    def __del__(self) -> None:
+        # Don't lose buffered text when the owning terminal is discarded
+        self.flush()
+
+
+# Buffered terminals still alive, flushed once at interpreter exit
+_buffered_terminals = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_buffered_terminals() -> None:
+    for terminal in list(_buffered_terminals):
+        terminal.flush()
 
 
 class Terminal:
     """
     A class to handle terminal printing with colors and styles.
 
+    With buffered=True all output of the terminal is collected in a buffer and
+    written to stdout on flush(), at color_context exit, when the buffer fills
+    up, or at interpreter exit. When stdout is a TTY the buffer is also flushed
+    at the end of each line, so interactive output is not delayed. A plain
+    print() bypasses this buffer, so use Terminal.print or call flush() first
+    to keep the output in order.
+
     Attributes:
         _force_color (bool): Whether to force color output.
         _color_enabled (bool): Whether color output is enabled.
-        _colors (dict): Mapping of color names to their ANSI codes.
-        _backgrounds (dict): Mapping of background color names to their ANSI codes.
-        _styles (dict): Mapping of style names to their ANSI codes.
-        _original_print (Callable): Original built-in print function.
-        _style_stack (list): Stack to keep track of nested styles.
+        _colors (Mapping): Mapping of color names to their ANSI codes.
+        _backgrounds (Mapping): Mapping of background color names to their ANSI codes.
+        _styles (Mapping): Mapping of style names to their ANSI codes.
+        _styled_print_cache (dict): Styled print functions keyed by colors and styles.
+        _prefix_cache (dict): ANSI code prefixes keyed by colors and styles.
+        _out (ColoredStdout): Output buffer in buffered mode, otherwise None.
+        _is_tty (bool): Whether stdout was a TTY when the terminal was created.
 
     Methods:
         _get_style_codes(fg_color, bg_color, styles):
@@ -142,8 +225,15 @@ class Terminal:
         _create_styled_print(style_codes):
             Create a styled print function with the given style codes.
 
+        _get_styled_print(fg_color, bg_color, styles):
+            Get a cached styled print function for the given colors and styles.
+
         color_context(fg_color="default", bg_color=None, styles=None):
-            Context manager to temporarily set the print function to use styles.
+            Context manager to apply styles to this terminal's print calls within
+            it. The built-in print() is not affected; use Terminal.print instead.
+
+        print(*args, **kwargs):
+            Print with the styles of the current color_context, if any.
 
         _write_style_begin(fg_color, bg_color, styles):
             Write the beginning style codes to the terminal.
@@ -151,11 +241,10 @@ class Terminal:
         _write_style_end():
             Write the reset code to the terminal to end styles.
 
-        _format_message(message, prefix=None):
-            Format a message with an optional prefix.
-
-        _print_styled(message, prefix=None, fg_color="default", bg_color=None, styles=None):
-            Print a styled message with optional prefix and colors.
+        _emit(prefix_str, message, fg_color="default", bg_color=None, styles=None,
+              end="\n"):
+            Write a styled message with a single write to stdout, or print it
+            plainly when color is disabled.
 
         print_note(message, bg_color=None, styles=None):
             Print a note message in green.
@@ -171,29 +260,62 @@ class Terminal:
 
         cprint(message, fg_color="default", bg_color=None, styles=None):
             Print a custom styled message.
+
+        flush():
+            Flush buffered output to stdout.
     """
 
-    def __init__(self, force_color: bool = False):
+    __slots__ = (
+        "_force_color",
+        "_color_enabled",
+        "_colors",
+        "_backgrounds",
+        "_styles",
+        "_styled_print_cache",
+        "_prefix_cache",
+        "_out",
+        "_is_tty",
+        "__weakref__",
+    )
+
+    _PREFIX_NOTE = "[NOTE] "
+    _PREFIX_WARNING = "[WARNING] "
+    _PREFIX_ERROR = "[ERROR] "
+    _PREFIX_INFO = "[INFO] "
+
+    def __init__(
+        self,
+        force_color: bool = False,
+        buffered: bool = False,
+        buffer_size: int = ColoredStdout.BUFFER_SIZE,
+    ):
+        is_tty = _isatty(sys.stdout)
         self._force_color = force_color
-        self._color_enabled = force_color or (
-            hasattr(sys.stdout, "isatty")
-            and sys.stdout.isatty()
-            and not os.environ.get("NO_COLOR")
-        )
-        self._colors = {color.name.lower(): color.value for color in TerminalColor}
-        self._backgrounds = {
-            color.name.lower(): color.value for color in BackgroundColor
-        }
-        self._styles = {style.name.lower(): style.value for style in Style}
-        self._original_print = builtins.print
-        self._style_stack = []
+        self._color_enabled = force_color or (is_tty and not os.environ.get("NO_COLOR"))
+        self._colors = _COLORS
+        self._backgrounds = _BACKGROUNDS
+        self._styles = _STYLES
+        self._styled_print_cache = {}
+        self._prefix_cache = {}
+
+        if buffered:
+            self._out = ColoredStdout(buffer_size, line_buffering=is_tty)
+            _buffered_terminals.add(self)
+        else:
+            self._out = None
+        self._is_tty = is_tty
 
     def _get_style_codes(
         self,
         fg_color: str,
         bg_color: Optional[str],
-        styles: Optional[Union[str, List[str]]],
+        styles: Optional[Tuple[str, ...]],
     ) -> str:
+        key = (fg_color, bg_color, styles)
+        cached = self._prefix_cache.get(key)
+        if cached is not None:
+            return cached
+
         codes = []
 
         if fg_color:
@@ -211,40 +333,65 @@ class Terminal:
                 return ""
 
         if styles:
-            style_list = [styles] if isinstance(styles, str) else styles
-            for style in style_list:
+            for style in styles:
                 try:
                     codes.append(self._styles[style.lower()])
                 except KeyError:
                     self.print_error(f"Invalid style: {style}")
                     return ""
 
-        return "".join(codes)
+        style_codes = "".join(codes)
+        self._prefix_cache[key] = style_codes
+        return style_codes
 
     def _create_styled_print(self, style_codes: str) -> Callable:
+        # Capture what the closure needs rather than self, which caches it
+        buffered_out = self._out
+        stdout_is_tty = self._is_tty
+
+        def styled_print(*args, sep=" ", end="\n", file=None, flush=False):
+            # None selects the defaults, as with the built-in print
+            if sep is None:
+                sep = " "
+            if end is None:
+                end = "\n"
+
+            if len(args) == 1 and type(args[0]) is str:
+                # Common case of a single string needs no conversion or join
+                message = args[0]
+            else:
+                # Convert all arguments to strings and join with separator
+                message = sep.join([str(arg) for arg in args])
+
+            # Write the style codes, message, and reset code in one call
+            text = "".join((style_codes, message, _RESET, end))
+            if file is None:
+                out = buffered_out or sys.stdout
+                is_tty = stdout_is_tty
+            else:
+                out = file
+                is_tty = _isatty(file)
+            out.write(text)
+            # A line-buffered TTY flushes on newline by itself
+            if flush or ("\n" not in end and is_tty):
+                out.flush()
 
-        def styled_print(*args, **kwargs):
-            # Get the separator and end values, or use defaults
-            sep = kwargs.get("sep", " ")
-            end = kwargs.get("end", "\n")
-
-            # Remove sep and end from kwargs if present
-            kwargs.pop("sep", None)
-            kwargs.pop("end", None)
-
-            # Convert all arguments to strings
-            strings = [str(arg) for arg in args]
-
-            # Join with separator
-            message = sep.join(strings)
-
-            # Write the style codes, message, and reset code
-            sys.stdout.write(style_codes)
-            sys.stdout.write(message)
-            sys.stdout.write(TerminalColor.RESET.value)
-            sys.stdout.write(end)
-            sys.stdout.flush()
+        return styled_print
 
+    def _get_styled_print(
+        self,
+        fg_color: str,
+        bg_color: Optional[str],
+        styles: Optional[Tuple[str, ...]],
+    ) -> Callable:
+        key = (fg_color, bg_color, styles)
+        styled_print = self._styled_print_cache.get(key)
+        if styled_print is None:
+            style_codes = self._get_style_codes(fg_color, bg_color, styles)
+            styled_print = self._create_styled_print(style_codes)
+            # Don't cache failed lookups so the error is reported on every call
+            if key in self._prefix_cache:
+                self._styled_print_cache[key] = styled_print
         return styled_print
 
     @contextmanager
@@ -258,80 +405,70 @@ class Terminal:
             yield
             return
 
-        style_codes = self._get_style_codes(fg_color, bg_color, styles)
-
-        # Store the original print function
-        original_print = builtins.print
+        styles = _norm_styles(styles)
+        styled_print = self._get_styled_print(fg_color, bg_color, styles)
 
+        # Make Terminal.print use our styled version in this context only
+        active = dict(_active_styled_prints.get())
+        active[self] = styled_print
+        token = _active_styled_prints.set(active)
         try:
-            # Replace the built-in print with our styled version
-            builtins.print = self._create_styled_print(style_codes)
             yield
         finally:
-            # Restore the original print function
-            builtins.print = original_print
+            _active_styled_prints.reset(token)
             # Ensure we're back to normal
-            sys.stdout.write(TerminalColor.RESET.value)
-            sys.stdout.flush()
+            out = self._out or sys.stdout
+            out.write(_RESET)
+            out.flush()
+
+    def print(self, *args, **kwargs) -> None:
+        styled_print = _active_styled_prints.get().get(self)
+        if styled_print is None:
+            # Unstyled output still goes through the buffer to keep its order
+            if self._out is not None:
+                kwargs.setdefault("file", self._out)
+            builtins.print(*args, **kwargs)
+        else:
+            styled_print(*args, **kwargs)
 
     def _write_style_begin(
         self,
         fg_color: str,
         bg_color: Optional[str],
-        styles: Optional[Union[str, List[str]]],
+        styles: Optional[Tuple[str, ...]],
     ) -> None:
-        codes = []
-
-        # Add color codes
-        if fg_color:
-            try:
-                codes.append(self._colors[fg_color.lower()])
-            except KeyError:
-                self.print_error(f"Invalid color: {fg_color}")
-                return
-
-        if bg_color:
-            try:
-                codes.append(self._backgrounds[bg_color.lower()])
-            except KeyError:
-                self.print_error(f"Invalid background color: {bg_color}")
-                return
-
-        # Add style codes
-        if styles:
-            style_list = [styles] if isinstance(styles, str) else styles
-            for style in style_list:
-                try:
-                    codes.append(self._styles[style.lower()])
-                except KeyError:
-                    self.print_error(f"Invalid style: {style}")
-                    return
+        codes = self._get_style_codes(fg_color, bg_color, styles)
 
+        # Left unflushed; _write_style_end flushes both writes together
         if codes:
-            self._original_stdout.write("".join(codes))
-            self._original_stdout.flush()
+            (self._out or sys.stdout).write(codes)
 
     def _write_style_end(self) -> None:
-        self._original_stdout.write(TerminalColor.RESET.value)
-        self._original_stdout.flush()
-
-    def _format_message(self, message: str, prefix: Optional[str] = None) -> str:
-        if prefix:
-            return f"[{prefix}] {message}"
-        return message
+        out = self._out or sys.stdout
+        out.write(_RESET)
+        out.flush()
 
-    @check_terminal_support
-    def _print_styled(
+    def _emit(
         self,
+        prefix_str: str,
         message: str,
-        prefix: Optional[str] = None,
         fg_color: str = "default",
         bg_color: Optional[str] = None,
         styles: Optional[Union[str, List[str]]] = None,
+        end: str = "\n",
     ) -> None:
-        formatted_message = self._format_message(message, prefix)
-        with self.color_context(fg_color, bg_color, styles):
-            print(formatted_message)
+        if not self._color_enabled:
+            # file=None is sys.stdout; in buffered mode this keeps output in order
+            print(f"{prefix_str}{message}", end=end, file=self._out)
+            return
+
+        # Styles are normalized here so the plain path never touches them
+        style_codes = self._get_style_codes(fg_color, bg_color, _norm_styles(styles))
+        out = self._out or sys.stdout
+        out.write("".join((style_codes, prefix_str, str(message), _RESET, end)))
+        # A line-buffered TTY flushes on newline by itself
+        if "\n" not in end and self._is_tty:
+            out.flush()
 
     def print_note(
         self,
@@ -339,7 +476,7 @@ class Terminal:
         bg_color: Optional[str] = None,
         styles: Optional[Union[str, List[str]]] = None,
     ) -> None:
-        self._print_styled(message, "NOTE", "green", bg_color, styles)
+        self._emit(self._PREFIX_NOTE, message, "green", bg_color, styles)
 
     def print_warning(
         self,
@@ -347,7 +484,7 @@ class Terminal:
         bg_color: Optional[str] = None,
         styles: Optional[Union[str, List[str]]] = None,
     ) -> None:
-        self._print_styled(message, "WARNING", "yellow", bg_color, styles)
+        self._emit(self._PREFIX_WARNING, message, "yellow", bg_color, styles)
 
     def print_error(
         self,
@@ -355,7 +492,7 @@ class Terminal:
         bg_color: Optional[str] = None,
         styles: Optional[Union[str, List[str]]] = None,
     ) -> None:
-        self._print_styled(message, "ERROR", "red", bg_color, styles)
+        self._emit(self._PREFIX_ERROR, message, "red", bg_color, styles)
 
     def print_info(
         self,
@@ -363,7 +500,7 @@ class Terminal:
         bg_color: Optional[str] = None,
         styles: Optional[Union[str, List[str]]] = None,
     ) -> None:
-        self._print_styled(message, "INFO", "cyan", bg_color, styles)
+        self._emit(self._PREFIX_INFO, message, "cyan", bg_color, styles)
 
     def cprint(
         self,
@@ -372,7 +509,10 @@ class Terminal:
         bg_color: Optional[str] = None,
         styles: Optional[Union[str, List[str]]] = None,
     ) -> None:
-        self._print_styled(message, None, fg_color, bg_color, styles)
+        self._emit("", message, fg_color, bg_color, styles)
+
+    def flush(self) -> None:
+        (self._out or sys.stdout).flush()
 
 
 # Usage example:
@@ -388,10 +528,10 @@ if __name__ == "__main__":
     # Custom styling
     term.cprint("Bold blue text on yellow background", "blue", "yellow", "bold")
 
-    # Using context manager with normal print statements
+    # Using context manager with term.print statements
     with term.color_context("red", "light_gray", ["bold", "underline"]):
-        print("This text is red, bold and underlined with light gray background")
-        print("Multiple lines with the same style")
+        term.print("This text is red, bold and underlined with light gray background")
+        term.print("Multiple lines with the same style")
 
     print("Back to normal text")
 
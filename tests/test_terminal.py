@@ -0,0 +1,151 @@
+import gc
+import io
+import unittest
+import weakref
+from contextlib import redirect_stdout
+
+from terminal import ColoredStdout, Terminal, _flush_buffered_terminals
+
+RED = "\033[31m"
+GREEN = "\033[32m"
+BLUE = "\033[34m"
+RESET = "\033[0m"
+
+
+class ColorContextTest(unittest.TestCase):
+    def capture(self, func):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            func()
+        return buf.getvalue()
+
+    def test_print_is_styled_only_inside_context(self):
+        term = Terminal(force_color=True)
+
+        def run():
+            term.print("before")
+            with term.color_context("red"):
+                term.print("inside")
+            term.print("after")
+
+        self.assertEqual(
+            self.capture(run),
+            f"before\n{RED}inside{RESET}\n{RESET}after\n",
+        )
+
+    def test_nested_contexts_restore_outer_style(self):
+        term = Terminal(force_color=True)
+
+        def run():
+            with term.color_context("red"):
+                with term.color_context("blue"):
+                    term.print("inner")
+                term.print("outer")
+
+        self.assertEqual(
+            self.capture(run),
+            f"{BLUE}inner{RESET}\n{RESET}{RED}outer{RESET}\n{RESET}",
+        )
+
+    def test_context_does_not_style_other_terminals(self):
+        colored = Terminal(force_color=True)
+        with redirect_stdout(io.StringIO()):
+            # Color support is detected from stdout, which is not a TTY here
+            plain = Terminal()
+
+        def run():
+            with colored.color_context("red"):
+                plain.print("plain")
+
+        self.assertEqual(self.capture(run), f"plain\n{RESET}")
+
+
+    def test_contexts_of_different_terminals_nest(self):
+        first = Terminal(force_color=True)
+        second = Terminal(force_color=True)
+
+        def run():
+            with first.color_context("red"):
+                with second.color_context("blue"):
+                    first.print("first")
+                    second.print("second")
+
+        self.assertEqual(
+            self.capture(run),
+            f"{RED}first{RESET}\n{BLUE}second{RESET}\n{RESET}{RESET}",
+        )
+
+
+class LifetimeTest(unittest.TestCase):
+    def test_terminal_is_freed_without_cyclic_gc(self):
+        gc.disable()
+        try:
+            with redirect_stdout(io.StringIO()):
+                term = Terminal(force_color=True)
+                term.print_note("note")
+                with term.color_context("red"):
+                    term.print("styled")
+            ref = weakref.ref(term)
+            del term
+            self.assertIsNone(ref())
+        finally:
+            gc.enable()
+
+
+class BufferedTest(unittest.TestCase):
+    def test_output_is_held_until_flush_and_kept_in_order(self):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            term = Terminal(force_color=True, buffered=True)
+            term.print_note("1")
+            term.print("2")
+            term.cprint("3", "red")
+            self.assertEqual(buf.getvalue(), "")
+            term.flush()
+        self.assertEqual(
+            buf.getvalue(), f"{GREEN}[NOTE] 1{RESET}\n2\n{RED}3{RESET}\n"
+        )
+
+    def test_plain_output_goes_through_buffer(self):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            term = Terminal(buffered=True)
+            term.print_note("1")
+            term.print("2")
+            self.assertEqual(buf.getvalue(), "")
+            # The exit hook flushes every buffered terminal still alive
+            _flush_buffered_terminals()
+        self.assertEqual(buf.getvalue(), "[NOTE] 1\n2\n")
+
+    def test_flushes_when_buffer_is_full(self):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            out = ColoredStdout(buffer_size=10)
+            out.write("12345")
+            self.assertEqual(buf.getvalue(), "")
+            out.write("67890")
+        self.assertEqual(buf.getvalue(), "1234567890")
+
+    def test_context_exit_flushes_to_redirected_stdout(self):
+        term = Terminal(force_color=True, buffered=True)
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            with term.color_context("red"):
+                term.print("inside")
+                self.assertEqual(buf.getvalue(), "")
+        self.assertEqual(buf.getvalue(), f"{RED}inside{RESET}\n{RESET}")
+
+    def test_discarded_terminal_is_freed_and_flushed(self):
+        buf = io.StringIO()
+        with redirect_stdout(buf):
+            term = Terminal(buffered=True)
+            ref = weakref.ref(term)
+            term.print_note("last words")
+            del term
+            gc.collect()
+        self.assertIsNone(ref())
+        self.assertEqual(buf.getvalue(), "[NOTE] last words\n")
+
+
+if __name__ == "__main__":
+    unittest.main()